@@ -842,26 +842,32 @@ class OpenADC(util.DisableNewAttr, ChipWhispererCommonInterface):
             Added poll_done parameter for Husky
 
         """
-        if self._is_husky and self.adc.segments > 1 and self.adc.presamples and self.adc.samples % 3:
+        # read the (cached) ADC settings once rather than going through the property chain for every use.
+        # adc.samples is left out: on CW-Pro a cold samples cache means a hardware read, which mustn't happen
+        # while the stream mode thread owns the bulk endpoint, so it's only read after sc.capture() (as before)
+        adc = self.adc
+        segments = adc.segments
+        stream_mode = adc.stream_mode
+
+        if self._is_husky and segments > 1 and adc.presamples and adc.samples % 3:
             raise ValueError('When using segments with presamples, the number of samples per segment (scope.adc.samples) must be a multiple of 3.')
 
-        if self._is_husky and (self.adc.decimate > 1) and (self.adc.presamples or self.adc.segments > 1):
-            raise ValueError('When decimate (%d) is used, presamples or segments cannot be used.' % self.adc.decimate)
+        if self._is_husky and (adc.decimate > 1) and (adc.presamples or segments > 1):
+            raise ValueError('When decimate (%d) is used, presamples or segments cannot be used.' % adc.decimate)
 
-        if self._is_husky and (self.adc.segments > 1) and (self.adc.samples * self.adc.segments > self.adc.oa.hwMaxSegmentSamples) and (not self.adc.stream_mode):
-            raise ValueError('When using segments and stream mode is disabled, the maximum total number of samples is %d.' % self.adc.oa.hwMaxSegmentSamples)
+        if self._is_husky and (segments > 1) and (adc.samples * segments > adc.oa.hwMaxSegmentSamples) and (not stream_mode):
+            raise ValueError('When using segments and stream mode is disabled, the maximum total number of samples is %d.' % adc.oa.hwMaxSegmentSamples)
 
-        if self.adc.stream_mode and (not self._is_husky):
+        if stream_mode and (not self._is_husky):
             a = self.sc.capture(None)
         else:
-            a = self.sc.capture(self.adc.offset, self.clock.adc_freq, self.adc.samples, self.adc.segments, self.adc.segment_cycles, poll_done)
+            a = self.sc.capture(adc.offset, self.clock.adc_freq, adc.samples, segments, adc.segment_cycles, poll_done)
 
         # _capture_read() must be given the total number of samples to read; in the case of Husky, self.adc.samples
         # is the number of samples *per segment*, so adjust accordingly:
+        samples = adc.samples
         if self._is_husky:
-            samples = self.adc.samples * self.adc.segments
-        else:
-            samples = self.adc.samples
+            samples *= segments
         b = self._capture_read(samples)
         return a or b
 
@@ -9,12 +9,10 @@
 import logging
 import sys
 import time
-import datetime
 from ...common.utils import util
 import array
 import numpy as np
 from collections import OrderedDict
-import copy
 
 from chipwhisperer.logging import *
 
@@ -95,6 +93,14 @@ STATUS_OVERFLOW_MASK = 0x80
 
 MSG_HDR_SIZE = 3
 
+# Shift vectors for unpacking FIFO words in processData(): 4 bytes -> 1 word,
+# then 1 word -> 3 10-bit samples + 2 trigger bits
+# (read-only, since they're shared by every capture)
+FIFO_WORD_SHIFTS   = np.array([24, 16, 8, 0], dtype=np.int64)
+FIFO_SAMPLE_SHIFTS = np.array([0, 10, 20, 30], dtype=np.int64)
+FIFO_WORD_SHIFTS.setflags(write=False)
+FIFO_SAMPLE_SHIFTS.setflags(write=False)
+
 # sign extend b low bits in x
 # from "Bit Twiddling Hacks"
 def SIGNEXT(x, b):
@@ -675,14 +681,13 @@ class OpenADCInterface(util.DisableNewAttr):
         if self._stream_mode:
 
             # Wait for a trigger, letting the UI run when it can
-            starttime = datetime.datetime.now()
+            deadline = time.monotonic() + self._timeout
             while self.serial.cmdReadStream_isDone(self._is_husky) == False:
                 # Wait for a moment before re-running the loop
                 time.sleep(0.05)
-                diff = datetime.datetime.now() - starttime
 
                 # If we've timed out, don't wait any longer for a trigger
-                if (diff.total_seconds() > self._timeout):
+                if time.monotonic() > deadline:
                     scope_logger.warning('Timeout in OpenADC capture(), no trigger seen! Trigger forced, data is invalid')
                     timeout = True
                     self.triggerNow()
@@ -710,16 +715,14 @@ class OpenADCInterface(util.DisableNewAttr):
                 timeout = True
         else:
             status = self.getStatus()
-            starttime = datetime.datetime.now()
+            deadline = time.monotonic() + self._timeout
 
             # Wait for a trigger
             while ((status & STATUS_ARM_MASK) == STATUS_ARM_MASK) | ((status & STATUS_FIFO_MASK) == 0):
                 status = self.getStatus()
 
-                diff = datetime.datetime.now() - starttime
-
                 # If we've timed out, don't wait any longer for a trigger
-                if (diff.total_seconds() > self._timeout):
+                if time.monotonic() > deadline:
                     scope_logger.warning('Timeout in OpenADC capture(), no trigger seen! Trigger forced, data is invalid. Status: %02x'%status)
                     timeout = True
                     self.triggerNow()
@@ -731,10 +734,9 @@ class OpenADCInterface(util.DisableNewAttr):
         # give time for ADC to finish reading data
         if self._is_husky and poll_done:
             # poll Husky to find out when the capture is complete:
-            starttime = datetime.datetime.now()
+            deadline = time.monotonic() + self._timeout
             while not self.sendMessage(CODE_READ, ADDR_CAPTURE_DONE, maxResp=1)[0]:
-                diff = datetime.datetime.now() - starttime
-                if (diff.total_seconds() > self._timeout):
+                if time.monotonic() > deadline:
                     scope_logger.warning('Timeout in OpenADC capture() waiting for scope "done" to go high.')
                     break
         else:
@@ -923,7 +925,6 @@ class OpenADCInterface(util.DisableNewAttr):
 
         scope_logger.debug("XXX read %d bytes; NumberPoints=%d, bytesToRead=%d" % (len(data), NumberPoints, bytesToRead))
         if data is not None:
-            data = np.array(data)
             datapoints = self.processHuskyData(NumberPoints, data)
         if datapoints is None:
             return []
@@ -932,11 +933,15 @@ class OpenADCInterface(util.DisableNewAttr):
 
     def processHuskyData(self, NumberPoints, data):
         if self._bits_per_sample == 12:
+            # view the raw bytes directly: the unpacking below makes its own copy
             data = np.frombuffer(data, dtype=np.uint8)
             fst_uint8, mid_uint8, lst_uint8 = np.reshape(data, (data.shape[0] // 3, 3)).astype(np.uint16).T
             fst_uint12 = (fst_uint8 << 4) + (mid_uint8 >> 4)
             snd_uint12 = ((mid_uint8 % 16) << 8) + lst_uint8
             data = np.reshape(np.concatenate((fst_uint12[:, None], snd_uint12[:, None]), axis=1), 2 * fst_uint12.shape[0])
+        else:
+            # copy: _int_data is handed to the user, and in stream mode the raw buffer is reused
+            data = np.array(data)
 
         self._int_data = data[:NumberPoints]
         fpData = data / 2**self._bits_per_sample - self.offset
@@ -951,7 +956,8 @@ class OpenADCInterface(util.DisableNewAttr):
 
         self._int_data = None
 
-        orig_data = copy.copy(data)
+        # only kept for the debug dump below; data isn't modified in place, so no copy is needed
+        orig_data = data
         if debug:
             fpData = []
             intData = []
@@ -1007,29 +1013,28 @@ class OpenADCInterface(util.DisableNewAttr):
 
             # Split data into groups of 4 bytes and combine into words
             data = np.reshape(data, (-1, 4))
-            data = np.left_shift(data, [24, 16, 8, 0])
+            data = np.left_shift(data, FIFO_WORD_SHIFTS)
             data = np.sum(data, 1)
 
             # Split words into samples and trigger bytes
-            data = np.right_shift(np.reshape(data, (-1, 1)), [0, 10, 20, 30]) & 0x3FF
+            data = np.right_shift(np.reshape(data, (-1, 1)), FIFO_SAMPLE_SHIFTS) & 0x3FF
             fpData = np.reshape(data[:, [0, 1, 2]], (-1))
             trigger = data[:, 3] % 4
             self._int_data = np.array(fpData, dtype='int16')
             fpData = fpData / 1024.0 - self.offset
-            scope_logger.debug("Trigger_data: {} len={}".format(trigger, len(trigger)))
+            scope_logger.debug("Trigger_data: %s len=%d", trigger, len(trigger))
             scope_logger.debug("Unprocessed data, fpData: {}, int_data: {}".format(len(fpData), len(self._int_data)))
 
-            # Search for the trigger signal
-            trigfound = False
-            trigsamp = 0
-            for t in trigger:
-                if(t != 3):
-                    trigfound = True
-                    trigsamp = trigsamp + (t & 0x3)
-                    scope_logger.debug("Trigger found at %d"%trigsamp)
-                    break
-                else:
-                    trigsamp += 3
+            # Search for the trigger signal: the first word whose trigger bits aren't 3;
+            # every word before it holds 3 pre-trigger samples
+            trigwords = np.flatnonzero(trigger != 3)
+            if len(trigwords):
+                trigfound = True
+                trigsamp = int(3 * trigwords[0] + (trigger[trigwords[0]] & 0x3))
+                scope_logger.debug("Trigger found at %d"%trigsamp)
+            else:
+                trigfound = False
+                trigsamp = 3 * len(trigger)
 
         #print len(fpData)
 
@@ -1037,7 +1042,7 @@ class OpenADCInterface(util.DisableNewAttr):
             scope_logger.warning('Trigger not found in ADC data. No data reported!')
             scope_logger.debug('Trigger not found typically caused by the actual \
             capture starting too late after the trigger event happens')
-            scope_logger.debug('Data: {}'.format(orig_data))
+            scope_logger.debug('Data: %s', orig_data)
 
 
         #Ensure that the trigger point matches the requested by padding/chopping
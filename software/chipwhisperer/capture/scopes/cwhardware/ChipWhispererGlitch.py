@@ -26,7 +26,7 @@
 #=================================================
 from ....logging import *
 import zipfile
-import datetime
+import time
 import math
 from ....capture.scopes.cwhardware import PartialReconfiguration as pr
 from ....common.utils import util
@@ -912,11 +912,10 @@ class ChipWhispererGlitch(object):
             self.oa.sendMessage(CODE_WRITE, glitchaddr, current, Validate=False)
             # Large adjustments can take a while so it's important to check if done. It *is* possible to trigger a glitch, following an adjustment,
             # before the adjustment is complete!
-            starttime = datetime.datetime.now()
+            deadline = time.monotonic() + self._timeout
             done = False
             while not done:
-                diff = datetime.datetime.now() - starttime
-                if (diff.total_seconds() > self._timeout):
+                if time.monotonic() > deadline:
                     scope_logger.warning('Timeout in phase adjustment. Increase self._timeout. This should not be necessary unless you make *huge* width jumps.')
                     break
                 raw = self.oa.sendMessage(CODE_READ, glitchaddr, Validate=False, maxResp=5)
@@ -953,11 +952,10 @@ class ChipWhispererGlitch(object):
             self.oa.sendMessage(CODE_WRITE, glitchaddr, current, Validate=False)
             # Large adjustments can take a while so it's important to check if done. It *is* possible to trigger a glitch, following an adjustment,
             # before the adjustment is complete!
-            starttime = datetime.datetime.now()
+            deadline = time.monotonic() + self._timeout
             done = False
             while not done:
-                diff = datetime.datetime.now() - starttime
-                if (diff.total_seconds() > self._timeout):
+                if time.monotonic() > deadline:
                     scope_logger.warning('Timeout in phase adjustment. Increase self._timeout. This should not be necessary unless you make *huge* offset jumps.')
                     break
                 raw = self.oa.sendMessage(CODE_READ, glitchaddr, Validate=False, maxResp=5)
@@ -29,7 +29,6 @@ from ...hardware.naeusb.programmer_stm32fserial import STM32FSerial
 from ...common.utils.util import camel_case_deprecated, DelayedKeyboardInterrupt
 from ..api.cwcommon import ChipWhispererCommonInterface, ChipWhispererSAMErrors
 import time
-import datetime
 
 
 
@@ -695,14 +694,13 @@ is in an error state, or is being used by another tool.") from e
         """Raises IOError if unknown failure, returns 'True' if timeout, 'False' if no timeout"""
 
         with DelayedKeyboardInterrupt():
-            starttime = datetime.datetime.now()
+            deadline = time.monotonic() + self._timeout
             while self._cwusb.readCtrl(self.REQ_ARM, dlen=1)[0] == 0:
                 # Wait for a moment before re-running the loop
                 time.sleep(0.001)
-                diff = datetime.datetime.now() - starttime
 
                 # If we've timed out, don't wait any longer for a trigger
-                if (diff.total_seconds() > self._timeout):
+                if time.monotonic() > deadline:
                     scope_logger.warning('Timeout in cwnano capture()')
                     return True
 
@@ -719,7 +717,7 @@ is in an error state, or is being used by another tool.") from e
                     scope_logger.warning("Couldn't read trace data back from Nano")
                     return True
             self._lasttrace_int = np.array(self._lasttrace)
-            self._lasttrace = np.array(self._lasttrace) / 256.0 - 0.5
+            self._lasttrace = self._lasttrace_int / 256.0 - 0.5
 
             #self.newDataReceived(0, self._lasttrace, 0, self.adc.clk_freq)
 